@@ -1,30 +1,47 @@
 import os
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, unless the environment is managed
+# elsewhere (systemd, containers) and POSTGRES_BACKUP_SKIP_DOTENV=1 says so
+if os.getenv('POSTGRES_BACKUP_SKIP_DOTENV') != '1':
+    load_dotenv()
 
 # Get the base directory (project root, one level up from src)
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    DB_HOST = os.getenv('DB_HOST', 'localhost')
-    DB_PORT = os.getenv('DB_PORT', '5432')
-    DB_NAME = os.getenv('DB_NAME', 'keap_db')
-    DB_USER = os.getenv('DB_USER', 'postgres')
-    DB_PASSWORD = os.getenv('DB_PASSWORD', 'secret')
+    DB_HOST: str
+    DB_PORT: str
+    DB_NAME: str
+    DB_USER: str
+    DB_PASSWORD: str = field(repr=False)
     
     # Backup settings
-    BACKUP_DIR = os.getenv('BACKUP_DIR', os.path.join(base_dir, 'backups'))
-    COMPRESSION_FORMAT = os.getenv('COMPRESSION_FORMAT', 'gzip')  # gzip or custom
+    BACKUP_DIR: str
+    COMPRESSION_FORMAT: str  # gzip or zstd
     
-    @classmethod
-    def get_db_url(cls) -> str:
+    def get_db_url(self) -> str:
         """Get database connection URL."""
-        return f"postgresql://{cls.DB_USER}:{cls.DB_PASSWORD}@{cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}"
+        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
-    @classmethod
-    def ensure_backup_dir(cls) -> None:
+    def ensure_backup_dir(self) -> None:
         """Ensure backup directory exists."""
-        Path(cls.BACKUP_DIR).mkdir(parents=True, exist_ok=True) 
\ No newline at end of file
+        Path(self.BACKUP_DIR).mkdir(parents=True, exist_ok=True)
+
+# Upper bound on concurrent CSV workers, each holding one server connection.
+# Kept here, free of database imports, so the CLI can show it in --help.
+MAX_CSV_WORKERS = 8
+
+# Settings are read from the environment once, at import
+CONFIG = Config(
+    DB_HOST=os.getenv('DB_HOST', 'localhost'),
+    DB_PORT=os.getenv('DB_PORT', '5432'),
+    DB_NAME=os.getenv('DB_NAME', 'keap_db'),
+    DB_USER=os.getenv('DB_USER', 'postgres'),
+    DB_PASSWORD=os.getenv('DB_PASSWORD', 'secret'),
+    BACKUP_DIR=os.getenv('BACKUP_DIR', os.path.join(base_dir, 'backups')),
+    COMPRESSION_FORMAT=os.getenv('COMPRESSION_FORMAT', 'gzip'),
+)
@@ -1,12 +1,79 @@
 #!/usr/bin/env python3
+import atexit
+import functools
+import logging
+import os
+import sys
 import click
-from typing import List
-from rich.console import Console
-from rich.panel import Panel
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
-from .db_operations import DatabaseOperations
+from .config import MAX_CSV_WORKERS
 
-console = Console()
+if TYPE_CHECKING:
+    from .db_operations import DatabaseOperations
+
+logger = logging.getLogger("postgres-backup")
+
+# Parallel COPY connections for CSV export/import
+DEFAULT_CSV_JOBS = min(os.cpu_count() or 1, MAX_CSV_WORKERS)
+
+# Parallel pg_dump/pg_restore jobs
+DEFAULT_DUMP_JOBS = os.cpu_count() or 1
+
+# Process exit status of a failed command
+EXIT_FAILURE = 1
+
+@functools.lru_cache(maxsize=None)
+def get_console():
+    """Create the Rich console on first use, so --help never imports Rich."""
+    from rich.console import Console
+    console = Console()
+    # Failed commands exit directly, so make sure everything printed reaches the terminal
+    atexit.register(console.file.flush)
+    return console
+
+def make_db_ops() -> "DatabaseOperations":
+    """Create DatabaseOperations, importing the database driver only when a command needs it."""
+    from .db_operations import DatabaseOperations
+    return DatabaseOperations()
+
+@functools.lru_cache(maxsize=128)
+def _csv_or_all(items: Optional[Tuple[str, ...]], default: str = "All") -> str:
+    """Label a tuple of names for display, or give the default when it is empty."""
+    return ", ".join(items) if items else default
+
+def show_panel(title: str, heading: str, fields: Dict[str, object]) -> None:
+    """Show operation details as a panel on a terminal, or as one log line otherwise."""
+    lines = [heading, *(f"{label}: {value}" for label, value in fields.items())]
+    console = get_console()
+    if console.is_terminal:
+        from rich.panel import Panel
+        # Sized to the prebuilt body instead of measuring Panel.fit's renderable
+        body = "\n".join(lines)
+        console.print(Panel(body, title=title, expand=False))
+    else:
+        # Redirected output gets no layout, styling or width probing
+        logger.info(f"{title}: {'; '.join(lines)}")
+
+def run_op(title: str, name: str, fields: Dict[str, object], op: Callable[[], bool]) -> None:
+    """Show an operation's details, run it and report the outcome.
+    
+    Exits the process with EXIT_FAILURE if the operation failed.
+    
+    Args:
+        title: Title of the details panel.
+        name: Operation name used in messages, e.g. 'backup' or 'CSV export'.
+        fields: Details shown before the operation starts, by label.
+        op: Runs the operation and returns True on success.
+    """
+    show_panel(title, f"Starting {name} operation", fields)
+    
+    outcome = name[0].upper() + name[1:]
+    if op():
+        get_console().print(f"[green]{outcome} completed successfully![/green]")
+    else:
+        get_console().print(f"[red]{outcome} failed![/red]")
+        sys.exit(EXIT_FAILURE)
 
 @click.group()
 def cli():
@@ -16,110 +83,178 @@ def cli():
 @cli.command()
 @click.option('--schemas', '-s', multiple=True, help='Specific schemas to backup')
 @click.option('--tables', '-t', multiple=True, help='Specific tables to backup (format: schema.table)')
-def backup(schemas, tables):
+@click.option('--format', '-F', 'backup_format', type=click.Choice(['directory', 'custom', 'plain']),
+              default='directory', show_default=True,
+              help='Backup format: parallel directory archive, single-file custom archive, or compressed SQL')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_DUMP_JOBS, show_default=True,
+              help='Number of tables to dump in parallel (a directory backup with one job is written as a custom archive)')
+@click.option('--compressor', type=click.Choice(['zstd', 'gzip', 'none']),
+              help='Backup compression (default: COMPRESSION_FORMAT for plain backups, built-in gzip for archives)')
+@click.option('--compression-level', '-Z', type=click.IntRange(min=1, max=19),
+              help='Compression level (gzip 1-9, zstd 1-19; default: 6 for gzip, 3 for zstd)')
+@click.option('--verbose', '-v', is_flag=True, help='Log every object as pg_dump dumps it')
+def backup(schemas, tables, backup_format, jobs, compressor, compression_level, verbose):
     """Create a database backup"""
-    db_ops = DatabaseOperations()
-    schemas_list = list(schemas) if schemas else None
-    tables_list = list(tables) if tables else None
+    db_ops = make_db_ops()
+    config = db_ops.config
+    db_name, db_host = config.DB_NAME, config.DB_HOST
     
-    console.print(Panel.fit(
-        f"Starting backup operation\n"
-        f"Database: {db_ops.config.DB_NAME}\n"
-        f"Host: {db_ops.config.DB_HOST}\n"
-        f"Schemas: {', '.join(schemas_list) if schemas_list else 'All'}\n"
-        f"Tables: {', '.join(tables_list) if tables_list else 'All'}",
-        title="Backup Information"
-    ))
-    
-    if db_ops.backup(schemas=schemas_list, tables=tables_list):
-        console.print("[green]Backup completed successfully![/green]")
-    else:
-        console.print("[red]Backup failed![/red]")
-        raise click.Abort()
+    run_op(
+        "Backup Information",
+        "backup",
+        {
+            "Database": db_name,
+            "Host": db_host,
+            "Schemas": _csv_or_all(schemas),
+            "Tables": _csv_or_all(tables),
+            "Format": backup_format,
+            "Compressor": compressor or 'default',
+            "Compression level": compression_level or 'default',
+            "Parallel jobs": jobs
+        },
+        functools.partial(
+            db_ops.backup,
+            schemas=schemas,
+            tables=tables,
+            backup_format=backup_format,
+            jobs=jobs,
+            compressor=compressor,
+            compression_level=compression_level,
+            verbose=verbose
+        )
+    )
 
 @cli.command()
 @click.argument('backup_file', type=click.Path(exists=True))
 @click.option('--schemas', '-s', multiple=True, help='Specific schemas to restore')
 @click.option('--tables', '-t', multiple=True, help='Specific tables to restore (format: schema.table)')
-def restore(backup_file, schemas, tables):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_DUMP_JOBS, show_default=True,
+              help='Number of parallel restore jobs for custom and directory archives')
+@click.option('--verbose', '-v', is_flag=True, help='Log every object as pg_restore restores it (archives only)')
+def restore(backup_file, schemas, tables, jobs, verbose):
     """Restore database from backup"""
-    db_ops = DatabaseOperations()
-    schemas_list = list(schemas) if schemas else None
-    tables_list = list(tables) if tables else None
+    db_ops = make_db_ops()
+    config = db_ops.config
+    db_name, db_host = config.DB_NAME, config.DB_HOST
     
-    console.print(Panel.fit(
-        f"Starting restore operation\n"
-        f"Database: {db_ops.config.DB_NAME}\n"
-        f"Host: {db_ops.config.DB_HOST}\n"
-        f"Backup file: {backup_file}\n"
-        f"Schemas: {', '.join(schemas_list) if schemas_list else 'All'}\n"
-        f"Tables: {', '.join(tables_list) if tables_list else 'All'}",
-        title="Restore Information"
-    ))
-    
-    if db_ops.restore(backup_file, schemas=schemas_list, tables=tables_list):
-        console.print("[green]Restore completed successfully![/green]")
-    else:
-        console.print("[red]Restore failed![/red]")
-        raise click.Abort()
+    run_op(
+        "Restore Information",
+        "restore",
+        {
+            "Database": db_name,
+            "Host": db_host,
+            "Backup file": backup_file,
+            "Schemas": _csv_or_all(schemas),
+            "Tables": _csv_or_all(tables),
+            "Parallel jobs": jobs
+        },
+        functools.partial(
+            db_ops.restore,
+            backup_file,
+            schemas=schemas,
+            tables=tables,
+            jobs=jobs,
+            verbose=verbose
+        )
+    )
 
 @cli.command()
 @click.option('--tables', '-t', multiple=True, help='Specific tables to export (format: schema.table)')
 @click.option('--output-dir', '-o', type=click.Path(), help='Directory to save CSV files')
-def export_csv(tables, output_dir):
+@click.option('--format', '-F', 'copy_format', type=click.Choice(['csv', 'binary']), default='csv',
+              help='File format: csv, or binary COPY files (.bin) for faster same-schema reloads')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_CSV_JOBS, show_default=True,
+              help='Number of tables to export in parallel')
+def export_csv(tables, output_dir, copy_format, jobs):
     """Export tables to CSV files
     
     If no tables are specified, exports all tables in the database.
     """
-    db_ops = DatabaseOperations()
-    tables_list = list(tables) if tables else None
-    
-    console.print(Panel.fit(
-        f"Starting CSV export operation\n"
-        f"Database: {db_ops.config.DB_NAME}\n"
-        f"Host: {db_ops.config.DB_HOST}\n"
-        f"Tables: {', '.join(tables_list) if tables_list else 'All'}\n"
-        f"Output directory: {output_dir or db_ops.config.BACKUP_DIR}",
-        title="CSV Export Information"
-    ))
+    db_ops = make_db_ops()
+    config = db_ops.config
+    db_name, db_host = config.DB_NAME, config.DB_HOST
     
-    if db_ops.export_to_csv(tables_list, output_dir):
-        console.print("[green]CSV export completed successfully![/green]")
-    else:
-        console.print("[red]CSV export failed![/red]")
-        raise click.Abort()
+    run_op(
+        "CSV Export Information",
+        "CSV export",
+        {
+            "Database": db_name,
+            "Host": db_host,
+            "Tables": _csv_or_all(tables),
+            "Format": copy_format,
+            "Parallel jobs": jobs,
+            "Output directory": output_dir or config.BACKUP_DIR
+        },
+        functools.partial(db_ops.export_to_csv, tables, output_dir, jobs=jobs, copy_format=copy_format)
+    )
 
 @cli.command()
-@click.option('--csv-files', '-f', multiple=True, type=click.Path(exists=True), help='Specific CSV files to import')
+@click.option('--csv-files', '-f', multiple=True,
+              help='Specific CSV files to import; a missing file stops the import after earlier files have loaded')
 @click.option('--input-dir', '-i', type=click.Path(exists=True), help='Directory containing CSV files to import')
 @click.option('--truncate', '-t', is_flag=True, help='Truncate tables before importing')
-def import_csv(csv_files, input_dir, truncate):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_CSV_JOBS, show_default=True,
+              help='Number of files to import in parallel')
+def import_csv(csv_files, input_dir, truncate, jobs):
     """Import data from CSV files into corresponding tables
     
     Either specify individual CSV files or a directory containing CSV files.
     If a directory is specified, all CSV files in that directory will be imported.
+    Files are only opened as they are imported, so a missing file stops the
+    import after the files before it have been loaded.
+    Binary COPY files (schema.table.bin) from 'export-csv --format binary' are
+    imported the same way, once their column manifest matches the target table.
     """
     if not csv_files and not input_dir:
-        console.print("[red]Error: Either --csv-files or --input-dir must be specified[/red]")
-        raise click.Abort()
+        get_console().print("[red]Error: Either --csv-files or --input-dir must be specified[/red]")
+        sys.exit(EXIT_FAILURE)
         
-    db_ops = DatabaseOperations()
-    files_list = list(csv_files) if csv_files else None
+    db_ops = make_db_ops()
+    config = db_ops.config
+    db_name, db_host = config.DB_NAME, config.DB_HOST
+    
+    run_op(
+        "CSV Import Information",
+        "CSV import",
+        {
+            "Database": db_name,
+            "Host": db_host,
+            "Files": _csv_or_all(csv_files, f"All files in {input_dir}"),
+            "Truncate tables": 'Yes' if truncate else 'No',
+            "Parallel jobs": jobs
+        },
+        functools.partial(db_ops.import_from_csv, csv_files, input_dir, truncate, jobs=jobs)
+    )
+
+@cli.command()
+@click.option('--tables', '-t', multiple=True, required=True, help='Tables to transfer (format: schema.table)')
+@click.option('--dst-dsn', required=True, help='Connection string of the destination database')
+@click.option('--src-dsn', help='Connection string of the source database (default: the configured database)')
+@click.option('--truncate', is_flag=True, help='Truncate destination tables before loading')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=DEFAULT_CSV_JOBS, show_default=True,
+              help='Number of tables to transfer in parallel')
+def transfer(tables, dst_dsn, src_dsn, truncate, jobs):
+    """Copy tables directly from one database into another
     
-    console.print(Panel.fit(
-        f"Starting CSV import operation\n"
-        f"Database: {db_ops.config.DB_NAME}\n"
-        f"Host: {db_ops.config.DB_HOST}\n"
-        f"Files: {', '.join(files_list) if files_list else f'All files in {input_dir}'}\n"
-        f"Truncate tables: {'Yes' if truncate else 'No'}",
-        title="CSV Import Information"
-    ))
+    Rows are streamed with binary COPY, without intermediate files. Destination
+    tables must already exist with the same column types.
+    """
+    db_ops = make_db_ops()
+    config = db_ops.config
+    db_name, db_host = config.DB_NAME, config.DB_HOST
     
-    if db_ops.import_from_csv(files_list, input_dir, truncate):
-        console.print("[green]CSV import completed successfully![/green]")
-    else:
-        console.print("[red]CSV import failed![/red]")
-        raise click.Abort()
+    run_op(
+        "Transfer Information",
+        "transfer",
+        {
+            "Source": db_ops.describe_dsn(src_dsn) if src_dsn else f'{db_name} on {db_host}',
+            "Destination": db_ops.describe_dsn(dst_dsn),
+            "Tables": _csv_or_all(tables),
+            "Truncate tables": 'Yes' if truncate else 'No',
+            "Parallel jobs": jobs
+        },
+        functools.partial(db_ops.transfer, tables, dst_dsn, src_dsn=src_dsn, truncate=truncate, jobs=jobs)
+    )
 
 if __name__ == '__main__':
     cli() 
\ No newline at end of file